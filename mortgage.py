@@ -1,33 +1,202 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from math import expm1, floor, log, log1p
+from typing import NamedTuple
 from matplotlib import pyplot as plt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+MAX_TERM = 480
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+@lru_cache(maxsize=8192)
+def _monthly_payment(amount: float, rate: float, term: int) -> float:
+    # expm1/log1p keep (1 + rate)**term - 1 accurate at small rates
+    # and avoid evaluating the power twice
+    c = expm1(term*log1p(rate))
+    return amount*rate*(c + 1)/c
+
 
 def monthly_payment(amount: float, rate: float, term: int) -> float:
-    return (amount*(rate*(1 + rate)**term)) / (((1 + rate)**term) - 1)
-
-
-def build_am_table(term: int, amount: float, rate: float, total_payment: float) -> pd.DataFrame:
-    months = [m for m in range(1, term + 1)]
-    interests = [amount*rate]
-    principals = [total_payment - interests[0]]
-    balances = [amount - principals[0]]
-    for _ in months[1:]:
-        interests.append(max(0, balances[-1]*rate))
-        principals.append(max(0, min(balances[-1] - interests[-1], total_payment - interests[-1])))
-        newbal = balances[-1] - principals[-1]
-        newbal = newbal if newbal > 1 else 0
-        balances.append(max(0, newbal))
-        
-    am_table = pd.DataFrame({
-        'month': months,
-        'interest': interests,
-        'principal': principals,
-        'balance': balances
-    })
-    
-    return am_table
+    # round at the cache boundary so fp noise in equivalent inputs
+    # still lands on the same key
+    return _monthly_payment(round(float(amount), 6), round(float(rate), 12), int(term))
+
+
+def _am_fill(term: int, amount: float, rate: float, total_payment: float,
+             interests, principals, balances):
+    bal = amount
+    for i in range(term):
+        # select/multiply forms compile to maxsd/minsd-style conditional
+        # moves rather than compare-and-branch pairs
+        inter = bal*rate
+        inter = inter if inter > 0.0 else 0.0
+        princ = bal - inter
+        cap = total_payment - inter
+        princ = princ if princ < cap else cap
+        princ = princ if princ > 0.0 else 0.0
+        bal = bal - princ
+        bal = bal*(bal > 1.0)
+        interests[i] = inter
+        principals[i] = princ
+        balances[i] = bal
+        # once paid off every remaining row is zero; the buffers are
+        # zero-filled, so stop iterating
+        if bal == 0.0:
+            break
+
+
+def _am_kernel(term: int, amount: float, rate: float, total_payment: float):
+    interests = np.zeros(term)
+    principals = np.zeros(term)
+    balances = np.zeros(term)
+    _am_fill(term, amount, rate, total_payment, interests, principals, balances)
+    return interests, principals, balances
+
+
+if njit is not None:
+    _am_fill = njit(cache=True, fastmath=True)(_am_fill)
+    _am_kernel = njit(cache=True, fastmath=True)(_am_kernel)
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _batch_am(terms, amounts, rates, payments):
+        n = terms.shape[0]
+        t_max = int(np.max(terms))
+        interests = np.zeros((n, t_max))
+        principals = np.zeros((n, t_max))
+        balances = np.zeros((n, t_max))
+        for i in prange(n):
+            t = terms[i]
+            _am_fill(t, amounts[i], rates[i], payments[i],
+                     interests[i, :t], principals[i, :t], balances[i, :t])
+        return interests, principals, balances
+
+    # warm the compiles so the first user request hits the on-disk cache
+    _am_kernel(1, 1.0, 0.01, 1.0)
+    _batch_am(np.ones(1, dtype=np.int64), np.ones(1), np.full(1, 0.01), np.ones(1))
+else:
+    _batch_am = None
+
+
+@lru_cache(maxsize=4096)
+def _base_interest(loan: float, c_rate: float, term: int, payoff: int) -> float:
+    # interest through month k is k payments less the principal retired,
+    # with the balance at k given by the geometric-series identity
+    payment = monthly_payment(loan, c_rate, term)
+    k = min(payoff, term)
+    growth = (1 + c_rate)**k
+    balance = max(0.0, loan*growth - payment*(growth - 1)/c_rate)
+    return payment*k - (loan - balance)
+
+
+@lru_cache(maxsize=8192)
+def _pmi_drop_month(loan: float, c_rate: float, payment: float, threshold: float,
+                    term: int) -> int:
+    # smallest m with loan*(1+r)^m - payment*((1+r)^m - 1)/r < threshold,
+    # i.e. (1+r)^m > (payment/r - threshold)/(payment/r - loan)
+    perpetuity = payment/c_rate
+    if perpetuity <= loan:
+        # payment never amortizes the balance below the threshold
+        return 0
+    ratio = (perpetuity - threshold)/(perpetuity - loan)
+    if ratio <= 1:
+        return 1
+    month = floor(log(ratio)/log1p(c_rate)) + 1
+    if month > term:
+        return 0
+    return month
+
+
+_MONTHS = np.arange(1, MAX_TERM + 1, dtype=np.int32)
+
+
+def _month_index(term: int) -> np.ndarray:
+    # zero-copy view for any term the UI allows
+    if term <= MAX_TERM:
+        return _MONTHS[:term]
+    return np.arange(1, term + 1, dtype=np.int32)
+
+
+class AmTable(NamedTuple):
+    month: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self._asdict())
+
+
+def build_am_table(term: int, amount: float, rate: float, total_payment: float) -> AmTable:
+    term = int(term)
+    interests, principals, balances = _am_kernel(term, amount, rate, total_payment)
+
+    return AmTable(
+        month=_month_index(term),
+        interest=interests,
+        principal=principals,
+        balance=balances
+    )
+
+
+def _resolve_loan(sale_price, dp_dollars, dp_percent, loan_amount, pmi_amount):
+    if (((loan_amount is None) or (loan_amount < 1))
+         and ((sale_price is None) or (sale_price < 1))):
+        raise ValueError('Sale price or loan amount must be defined and >= $1.')
+    elif ((pmi_amount is not None) and (pmi_amount > 0)
+          and ((sale_price is None) or (sale_price < 1))):
+        raise ValueError('If there is PMI, the sale price must be defined to calculate LTV.')
+    # if loan amount is defined, use it
+    elif (loan_amount is not None) and (loan_amount >= 1):
+        if (dp_dollars is None) and (dp_percent is None):
+            dp_dollars = 0
+            dp_percent = 0.0
+        elif dp_dollars is not None:
+            dp_percent = (dp_dollars/(loan_amount + dp_dollars))*100
+        else:
+            dp_dollars = ((dp_percent/100)*loan_amount)/(1 - (dp_percent/100))
+        sale_price = loan_amount + dp_dollars
+    # otherwise, use sale price
+    else:
+        if (dp_dollars is None) and (dp_percent is None):
+            dp_dollars = 0
+            dp_percent = 0.0
+        elif dp_dollars is not None:
+            dp_percent = (dp_dollars/sale_price)*100
+        else:
+            dp_dollars = sale_price*(dp_percent/100)
+        loan_amount = sale_price - dp_dollars
+    return sale_price, dp_dollars, dp_percent, loan_amount
+
+
+_SUMMARY_FORMATS = {
+    'Loan Amount': '${:,.0f}',
+    'Down Payment': '${:,.0f}',
+    'Term [months]': '{:.0f}',
+    'Rate [%]': '{:.3f}',
+    'Payment': '${:,.0f}',
+    'PITI Payment': '${:,.0f}',
+    'PMI Amount': '${:,.0f}',
+    'Additional Payment': '${:,.0f}',
+    'Total Payment': '${:,.0f}',
+    'PMI Drops Off At Month': '{:.0f}',
+    'Payoff [months]': '{:.0f}',
+    'Balance at Payoff': '${:,.0f}',
+    'Payoff Reason': '{}',
+    'Interest Paid': '${:,.0f}',
+    'Interest Saved from Added Payments': '${:,.0f}',
+    'Closing Costs': '${:,.0f}',
+    'Cash To Close': '${:,.0f}',
+    'Total Finance Costs': '${:,.0f}'
+}
 
 
 @dataclass
@@ -46,34 +215,13 @@ class mortgage:
     name: str = ''
     pmi_amount: float = 0.0
     pmi_ltv: float = 80.0
+    am_table: AmTable = None
 
     def __post_init__(self):
-        if (((self.loan_amount is None) or (self.loan_amount < 1))
-             and ((self.sale_price is None) or (self.sale_price < 1))):
-            raise ValueError('Sale price or loan amount must be defined and >= $1.')
-        elif ((self.pmi_amount is not None) and (self.pmi_amount > 0)
-              and ((self.sale_price is None) or (self.sale_price < 1))):
-            raise ValueError('If there is PMI, the sale price must be defined to calculate LTV.')
-        # if loan amount is defined, use it
-        elif (self.loan_amount is not None) and (self.loan_amount >= 1):
-            if (self.dp_dollars is None) and (self.dp_percent is None):
-                self.dp_dollars = 0
-                self.dp_percent = 0.0
-            elif self.dp_dollars is not None:
-                self.dp_percent = (self.dp_dollars/(self.loan_amount + self.dp_dollars))*100
-            else:
-                self.dp_dollars = ((self.dp_percent/100)*self.loan_amount)/(1 - (self.dp_percent/100))
-            self.sale_price = self.loan_amount + self.dp_dollars
-        # otherwise, use sale price
-        else:
-            if (self.dp_dollars is None) and (self.dp_percent is None):
-                self.dp_dollars = 0
-                self.dp_percent = 0.0
-            elif self.dp_dollars is not None:
-                self.dp_percent = (self.dp_dollars/self.sale_price)*100
-            else:
-                self.dp_dollars = self.sale_price*(self.dp_percent/100)
-            self.loan_amount = self.sale_price - self.dp_dollars
+        (self.sale_price, self.dp_dollars,
+         self.dp_percent, self.loan_amount) = _resolve_loan(
+            self.sale_price, self.dp_dollars, self.dp_percent,
+            self.loan_amount, self.pmi_amount)
 
         if self.insurance is None: self.insurance = 0.0
         if self.taxes is None: self.taxes = 0.0
@@ -84,59 +232,62 @@ class mortgage:
         if self.pmi_ltv is None: self.pmi_ltv = 80.0
         
         self.c_rate = self.rate/(100*12)
-        self.payoff = self.payoff_months if self.payoff_months is not None else self.term
+        self.payoff = int(self.payoff_months) if self.payoff_months is not None else int(self.term)
         self.base_payment = monthly_payment(self.loan_amount, self.c_rate, self.term)
         self.piti_payment = self.base_payment + self.insurance/12 + self.taxes/12
         self.payment = self.base_payment + self.add_payment
-        self.am_table_base = build_am_table(self.term, self.loan_amount, self.c_rate, self.base_payment)
-        self.am_table = build_am_table(self.term, self.loan_amount, self.c_rate, self.payment)
-        self.interest_paid_base = self.am_table_base.loc[self.am_table_base['month'] <= self.payoff,
-                                                         'interest'].sum()
-        self.interest_paid = self.am_table.loc[self.am_table['month'] <= self.payoff,
-                                               'interest'].sum()
-        self.interest_saved = self.interest_paid_base - self.interest_paid
+        if self.am_table is None:
+            self.am_table = build_am_table(self.term, self.loan_amount, self.c_rate, self.payment)
+        self.interest_paid_base = _base_interest(self.loan_amount, self.c_rate, self.term, self.payoff)
+        self.interest_paid = float(self.am_table.interest[:self.payoff].sum())
+        # the closed-form base and the iterated schedule differ by a
+        # float residual; clamp sub-cent savings so zero stays $0
+        diff = self.interest_paid_base - self.interest_paid
+        self.interest_saved = diff if abs(diff) > 0.005 else 0.0
         
         if self.pmi_amount <= 0: self.pmi_drop = 0
         else:
-            am_with_ltv = self.am_table.copy()
-            am_with_ltv['ltv'] = am_with_ltv.loc[:, 'balance']/self.sale_price
-            self.pmi_drop = am_with_ltv.loc[am_with_ltv['ltv'] < (self.pmi_ltv/100), 'month'].min()
+            self.pmi_drop = _pmi_drop_month(self.loan_amount, self.c_rate, self.payment,
+                                            self.sale_price*(self.pmi_ltv/100), self.term)
         self.pmi_total_cost = self.pmi_amount*self.pmi_drop
         self.finance_costs = self.interest_paid + self.closing_costs + self.pmi_total_cost
         
-        self.months_payoff_by_payment = self.am_table.loc[self.am_table['balance'] > 0, 'month'].max()
+        self.months_payoff_by_payment = int(self.am_table.month[self.am_table.balance > 0].max(initial=0))
         self.balance_at_payoff = 0
         self.payoff_reason = 'Payments'
         if self.months_payoff_by_payment > self.payoff:
-            self.balance_at_payoff = self.am_table.loc[self.am_table['month'] == self.payoff, 'balance'].values[0]
+            self.balance_at_payoff = float(self.am_table.balance[self.payoff - 1])
             self.payoff_reason = 'Sale/Paid Off'
         self.payoff_month = min(self.months_payoff_by_payment, self.payoff)
         self.cash_to_close = self.dp_dollars + self.closing_costs
-        
+
+    def summary_values(self):
+        return {
+            'Loan Amount': self.loan_amount,
+            'Down Payment': self.dp_dollars,
+            'Term [months]': self.term,
+            'Rate [%]': self.rate,
+            'Payment': self.base_payment,
+            'PITI Payment': self.piti_payment,
+            'PMI Amount': self.pmi_amount,
+            'Additional Payment': self.add_payment,
+            'Total Payment': self.piti_payment + self.add_payment + self.pmi_amount,
+            'PMI Drops Off At Month': self.pmi_drop,
+            'Payoff [months]': self.payoff_month,
+            'Balance at Payoff': self.balance_at_payoff,
+            'Payoff Reason': self.payoff_reason,
+            'Interest Paid': self.interest_paid,
+            'Interest Saved from Added Payments': self.interest_saved,
+            'Closing Costs': self.closing_costs,
+            'Cash To Close': self.cash_to_close,
+            'Total Finance Costs': self.finance_costs
+        }
+
     def summary(self):
-        values = [
-            ('Loan Amount', '${:,.0f}'.format(self.loan_amount)),
-            ('Down Payment', '${:,.0f}'.format(self.dp_dollars)),
-            ('Term [months]', '{:.0f}'.format(self.term)),
-            ('Rate [%]', '{:.3f}'.format(self.rate)),
-            ('Payment', '${:,.0f}'.format(self.base_payment)),
-            ('PITI Payment', '${:,.0f}'.format(self.piti_payment)),
-            ('PMI Amount', '${:,.0f}'.format(self.pmi_amount)),
-            ('Additional Payment', '${:,.0f}'.format(self.add_payment)),
-            ('Total Payment', '${:,.0f}'.format(self.piti_payment + self.add_payment + self.pmi_amount)),
-            ('PMI Drops Off At Month', '{:.0f}'.format(self.pmi_drop)),
-            ('Payoff [months]', '{:.0f}'.format(self.payoff_month)),
-            ('Balance at Payoff', '${:,.0f}'.format(self.balance_at_payoff)),
-            ('Payoff Reason', self.payoff_reason),
-            ('Interest Paid', '${:,.0f}'.format(self.interest_paid)),
-            ('Interest Saved from Added Payments', '${:,.0f}'.format(self.interest_saved)),
-            ('Closing Costs', '${:,.0f}'.format(self.closing_costs)),
-            ('Cash To Close', '${:,.0f}'.format(self.cash_to_close)),
-            ('Total Finance Costs', '${:,.0f}'.format(self.finance_costs))
-        ]
+        values = self.summary_values()
         table = pd.DataFrame({
-            'text': [v[0] for v in values],
-            'values': [v[1] for v in values]
+            'text': list(values),
+            'values': [_SUMMARY_FORMATS[k].format(v) for k, v in values.items()]
         })
         table = table.set_index('text')
         table.index.name = ''
@@ -147,23 +298,27 @@ class mortgage:
         return(str(self.summary()))
     
     def plot(self):
+        am = self.am_table
+        # interest decreases monotonically to its zero tail, so one
+        # searchsorted locates the last paying month for both series
+        last = int(np.searchsorted(-am.interest, 0.0))
         fig, ax1 = plt.subplots()
         ax1.plot(
-            [0] + self.am_table['month'].tolist(),
-            [self.loan_amount] + self.am_table['balance'].tolist(),
+            np.concatenate(([0], am.month)),
+            np.concatenate(([self.loan_amount], am.balance)),
             'b-', label='Balance'
         )
         ax1.set_ylabel('$\nBalance')
         ax1.set_xlabel('Month')
         ax2 = ax1.twinx()
         ax2.plot(
-            self.am_table.loc[self.am_table['interest'] > 0, 'month'],
-            self.am_table.loc[self.am_table['interest'] > 0, 'interest'],
+            am.month[:last],
+            am.interest[:last],
             'r-', label='Interest'
         )
         ax2.plot(
-            self.am_table.loc[self.am_table['principal'] > 0, 'month'],
-            self.am_table.loc[self.am_table['principal'] > 0, 'principal'],
+            am.month[:last],
+            am.principal[:last],
             'g-', label='Principal'
         )
         ax2.set_ylabel('$\nInterest\nPrincipal')
@@ -171,134 +326,207 @@ class mortgage:
         return fig
 
 
+@st.cache_data(max_entries=64)
+def _compute_mortgage(term, rate, sale_price, dp_dollars, dp_percent, loan_amount,
+                      insurance, taxes, add_payment, payoff_months, closing_costs,
+                      pmi_amount, pmi_ltv) -> mortgage:
+    # name is display-only and set by the caller, so renames reuse the cache
+    return mortgage(
+        term=term,
+        rate=rate,
+        sale_price=sale_price,
+        dp_dollars=dp_dollars,
+        dp_percent=dp_percent,
+        loan_amount=loan_amount,
+        insurance=insurance,
+        taxes=taxes,
+        add_payment=add_payment,
+        payoff_months=payoff_months,
+        closing_costs=closing_costs,
+        pmi_amount=pmi_amount,
+        pmi_ltv=pmi_ltv
+    )
+
+
+@st.cache_data
+def _read_inputs(raw: bytes) -> pd.DataFrame:
+    return pd.read_csv(BytesIO(raw))
+
+
+def _batch_am_tables(rows):
+    # resolve each row's loan and payment, then run every recurrence in
+    # one parallel kernel call
+    n = len(rows)
+    terms = np.empty(n, dtype=np.int64)
+    loans = np.empty(n)
+    c_rates = np.empty(n)
+    payments = np.empty(n)
+    for i, row in enumerate(rows):
+        _, _, _, loan = _resolve_loan(row.get('sale_price'), row.get('dp_dollars'),
+                                      row.get('dp_percent'), row.get('loan_amount'),
+                                      row.get('pmi_amount'))
+        term = int(row['term'])
+        c_rate = row['rate']/(100*12)
+        terms[i] = term
+        loans[i] = loan
+        c_rates[i] = c_rate
+        payments[i] = monthly_payment(loan, c_rate, term) + (row.get('add_payment') or 0.0)
+    interests, principals, balances = _batch_am(terms, loans, c_rates, payments)
+
+    return [AmTable(month=_month_index(t),
+                    interest=interests[i, :t],
+                    principal=principals[i, :t],
+                    balance=balances[i, :t])
+            for i, t in enumerate(terms)]
+
+
+@st.cache_data
 def compare_mortgages(inputs: pd.DataFrame) -> pd.DataFrame:
     """"""
-    inputs = inputs.where(pd.notnull(inputs), None)
-    table = None
-    for i in range(len(inputs)):
-        row = inputs.iloc[i, :].to_dict()
-        temp = mortgage(**row)
-
-        if table is None:
-            table = temp.summary()
-        else:
-            table_add = temp.summary()
-            table = pd.concat([table, table_add], axis=1, sort=False)
-            
+    cols = {c: inputs[c].to_numpy(dtype=object, na_value=None) for c in inputs.columns}
+    rows = [dict(zip(cols, values)) for values in zip(*cols.values())]
+    if (_batch_am is not None) and (len(rows) > 1):
+        tables = _batch_am_tables(rows)
+    else:
+        tables = [None]*len(rows)
+
+    names = []
+    summaries = []
+    for row, am in zip(rows, tables):
+        temp = mortgage(**row, am_table=am)
+        names.append(temp.name)
+        summaries.append(temp.summary_values())
+
+    table = pd.DataFrame(summaries, index=names).T
+    table.index.name = ''
     return table
 
 
+def style_summary(table: pd.DataFrame):
+    # values stay numeric in the table itself; the per-metric format
+    # strings only fire for cells that actually get rendered
+    styler = table.style
+    for metric, fmt in _SUMMARY_FORMATS.items():
+        if metric in table.index:
+            styler = styler.format(fmt, subset=pd.IndexSlice[[metric], :])
+    return styler
+
+
 st.title('Mortgage Summary')
 st.write('Fill out mortgage info in the sidebar to the left.')
 
 st.sidebar.subheader('Mortgage Info')
-name = st.sidebar.text_input(
-    'Name',
-    value='Option 1'
-)
-term = st.sidebar.number_input(
-    'Term [months]',
-    min_value=1,
-    max_value=480,
-    value=360,
-    step=1
-)
-rate = st.sidebar.number_input(
-    'Rate [%]',
-    min_value=0.0,
-    max_value=100.0,
-    value=3.0,
-    step=0.001
-)
+# the radios stay outside the form so the inputs they control can
+# switch right away; everything else waits for Compute
 sale_amt_select = st.sidebar.radio(
     'Sale Price or Loan Amount',
     ['Sale Price', 'Loan Amount']
 )
-if sale_amt_select == 'Sale Price':
-    sale_price = st.sidebar.number_input(
-        'Sale Price [$]',
+dp_select = st.sidebar.radio(
+    'Down Payment Option',
+    ['Dollars', 'Percent']
+)
+with st.sidebar.form('mortgage_form'):
+    name = st.text_input(
+        'Name',
+        value='Option 1'
+    )
+    term = st.number_input(
+        'Term [months]',
+        min_value=1,
+        max_value=MAX_TERM,
+        value=360,
+        step=1
+    )
+    rate = st.number_input(
+        'Rate [%]',
+        min_value=0.0,
+        max_value=100.0,
+        value=3.0,
+        step=0.001
+    )
+    if sale_amt_select == 'Sale Price':
+        sale_price = st.number_input(
+            'Sale Price [$]',
+            min_value=0.0,
+            max_value=10000000.0,
+            value=300000.0,
+            step=0.01
+        )
+    elif sale_amt_select == 'Loan Amount':
+        loan_amount = st.number_input(
+            'Loan Amount [$]',
+            min_value=0.0,
+            max_value=10000000.0,
+            value=240000.0,
+            step=0.01
+        )
+    if dp_select == 'Dollars':
+        dp_dollars = st.number_input(
+            'Down Payment [$]',
+            min_value=0.0,
+            max_value=10000000.0,
+            value=60000.0,
+            step=0.01
+        )
+    elif dp_select == 'Percent':
+        dp_percent = st.number_input(
+            'Down Payment [%]',
+            min_value=0.0,
+            max_value=100.0,
+            value=20.0,
+            step=0.01
+        )
+    insurance = st.number_input(
+        'Insurance (annual) [$]',
         min_value=0.0,
-        max_value=10000000.0,
-        value=300000.0,
+        max_value=1000000.0,
+        value=0.0,
         step=0.01
     )
-elif sale_amt_select == 'Loan Amount':
-    loan_amount = st.sidebar.number_input(
-        'Loan Amount [$]',
+    taxes = st.number_input(
+        'Taxes (annual) [$]',
         min_value=0.0,
-        max_value=10000000.0,
-        value=240000.0,
+        max_value=1000000.0,
+        value=0.0,
         step=0.01
     )
-dp_select = st.sidebar.radio(
-    'Down Payment Option',
-    ['Dollars', 'Percent']
-)
-if dp_select == 'Dollars':
-    dp_dollars = st.sidebar.number_input(
-        'Down Payment [$]',
+    add_payment = st.number_input(
+        'Additional Monthly Payment to Principal [$]',
         min_value=0.0,
-        max_value=10000000.0,
-        value=60000.0,
+        max_value=1000000.0,
+        value=0.0,
         step=0.01
     )
-elif dp_select == 'Percent':
-    dp_percent = st.sidebar.number_input(
-        'Down Payment [%]',
+    payoff_months = st.number_input(
+        'Payoff At Month',
+        min_value=0,
+        max_value=MAX_TERM,
+        value=0,
+        step=1
+    )
+    closing_costs = st.number_input(
+        'Closing Costs [$]',
+        min_value=-100000.0,
+        max_value=100000.0,
+        value=0.0,
+        step=0.01
+    )
+    pmi_amount = st.number_input(
+        'PMI Amount [$]',
+        min_value=0.0,
+        max_value=100000.0,
+        value=0.0,
+        step=0.01
+    )
+    pmi_ltv = st.number_input(
+        'PMI Drops Off at LTV [%]',
         min_value=0.0,
         max_value=100.0,
-        value=20.0,
+        value=80.0,
         step=0.01
     )
-insurance = st.sidebar.number_input(
-    'Insurance (annual) [$]',
-    min_value=0.0,
-    max_value=1000000.0,
-    value=0.0,
-    step=0.01
-)
-taxes = st.sidebar.number_input(
-    'Taxes (annual) [$]',
-    min_value=0.0,
-    max_value=1000000.0,
-    value=0.0,
-    step=0.01
-)
-add_payment = st.sidebar.number_input(
-    'Additional Monthly Payment to Principal [$]',
-    min_value=0.0,
-    max_value=1000000.0,
-    value=0.0,
-    step=0.01
-)
-payoff_months = st.sidebar.number_input(
-    'Payoff At Month',
-    min_value=0,
-    max_value=480,
-    value=0,
-    step=1
-)
-closing_costs = st.sidebar.number_input(
-    'Closing Costs [$]',
-    min_value=-100000.0,
-    max_value=100000.0,
-    value=0.0,
-    step=0.01
-)
-pmi_amount = st.sidebar.number_input(
-    'PMI Amount [$]',
-    min_value=0.0,
-    max_value=100000.0,
-    value=0.0,
-    step=0.01
-)
-pmi_ltv = st.sidebar.number_input(
-    'PMI Drops Off at LTV [%]',
-    min_value=0.0,
-    max_value=100.0,
-    value=80.0,
-    step=0.01
-)
+    submitted = st.form_submit_button('Compute')
 
 if sale_amt_select == 'Sale Price':
     loan_amount = None
@@ -310,31 +538,33 @@ elif dp_select == 'Percent':
     dp_dollars = None
 if payoff_months < 1: payoff_months = None
 
-mort = mortgage(
-    term=term,
-    rate=rate,
-    sale_price=sale_price,
-    dp_dollars=dp_dollars,
-    dp_percent=dp_percent,
-    loan_amount=loan_amount,
-    insurance=insurance,
-    taxes=taxes,
-    payoff_months=payoff_months,
-    add_payment=add_payment,
-    closing_costs=closing_costs,
-    pmi_amount=pmi_amount,
-    pmi_ltv=pmi_ltv,
-    name=name
-)
+if submitted or ('mort' not in st.session_state):
+    mort = _compute_mortgage(
+        term=term,
+        rate=rate,
+        sale_price=sale_price,
+        dp_dollars=dp_dollars,
+        dp_percent=dp_percent,
+        loan_amount=loan_amount,
+        insurance=insurance,
+        taxes=taxes,
+        payoff_months=payoff_months,
+        add_payment=add_payment,
+        closing_costs=closing_costs,
+        pmi_amount=pmi_amount,
+        pmi_ltv=pmi_ltv
+    )
+    mort.name = name
+    st.session_state['mort'] = mort
 
-st.text(mort)
+st.text(st.session_state['mort'])
 
 st.title('Mortgage Comparison')
 inputs_raw = st.file_uploader('Upload a file:', type=['csv'])
 if inputs_raw is not None:
-    inputs = pd.read_csv(inputs_raw)
+    inputs = _read_inputs(inputs_raw.getvalue())
     table = compare_mortgages(inputs)
-    st.dataframe(table, width=600, height=900)
+    st.dataframe(style_summary(table), width=600, height=900)
 
 st.write('Uploaded file should have these headers with the noted requirements:')
 upload_explain = pd.DataFrame({